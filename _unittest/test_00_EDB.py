@@ -16,6 +16,13 @@ try:
 except ImportError:
     import _unittest_ironpython.conf_unittest as pytest
 
+try:
+    import pandas  # noqa: F401
+
+    pandas_available = True
+except ImportError:
+    pandas_available = False
+
 
 class TestClass:
     def setup_class(self):
@@ -210,12 +217,38 @@ class TestClass:
     def test_26_get_through_resistor_list(self):
         assert self.edbapp.core_components.get_through_resistor_list(10)
 
+    def test_26b_get_through_resistor_lists(self):
+        through_resistors = self.edbapp.core_components.get_through_resistor_lists([1, 10])
+        assert through_resistors[10] == self.edbapp.core_components.get_through_resistor_list(10)
+        assert through_resistors[1] == self.edbapp.core_components.get_through_resistor_list(1)
+
     def test_27_get_rats(self):
         assert len(self.edbapp.core_components.get_rats()) > 0
 
+    def test_27b_iter_rats(self):
+        rats = self.edbapp.core_components.get_rats()
+        rows = list(self.edbapp.core_components.iter_rats())
+        assert len(rows) == sum(len(rat["refdes"]) for rat in rats)
+        expected = []
+        for rat in rats:
+            expected.extend(zip(rat["refdes"], rat["pin_name"], rat["net_name"]))
+        assert rows == expected
+
+    @pytest.mark.skipif(not pandas_available, reason="Requires pandas")
+    def test_27c_get_rats_dataframe(self):
+        rats = self.edbapp.core_components.get_rats_dataframe()
+        assert list(rats.columns) == ["refdes", "pin_name", "net_name"]
+        assert len(rats) == len(list(self.edbapp.core_components.iter_rats()))
+
     def test_28_get_component_connections(self):
         assert len(self.edbapp.core_components.get_component_net_connection_info("U2A5")) > 0
 
+    def test_28b_clear_cache(self):
+        connections = self.edbapp.core_components.get_component_net_connection_info("U2A5")
+        assert self.edbapp.core_components.clear_cache()
+        assert self.edbapp.core_components.get_component_net_connection_info("U2A5") == connections
+        assert "R1" in self.edbapp.core_components.resistors
+
     def test_29_get_power_tree(self):
         OUTPUT_NET = "BST_V1P0_S0"
         GROUND_NETS = ["GND", "PGND"]
@@ -325,8 +358,13 @@ class TestClass:
         assert self.edbapp.core_primitives.parametrize_trace_width("A0_N_R")
 
     def test_45_delete_net(self):
+        components = self.edbapp.core_components.get_components_from_nets("A0_N")
+        assert components
         nets_deleted = self.edbapp.core_nets.delete_nets("A0_N")
         assert "A0_N" in nets_deleted
+        assert not self.edbapp.core_components.get_components_from_nets("A0_N")
+        for component in components:
+            assert not self.edbapp.core_nets.is_net_in_component(component, "A0_N")
 
     def test_46_get_polygons_bounding(self):
         polys = self.edbapp.core_primitives.get_polygons_by_layer("GND")
@@ -423,7 +461,10 @@ class TestClass:
         assert os.path.exists(os.path.join(output, "edb.def"))
 
     def test_56_rvalue(self):
-        assert resistor_value_parser("100meg")
+        assert resistor_value_parser("100meg") == 1e8
+        assert resistor_value_parser("4.7k") == 4700.0
+        assert resistor_value_parser("10mOhm") == 0.01
+        assert resistor_value_parser("50") == 50.0
 
     def test_57_stackup_limits(self):
         assert self.edbapp.core_stackup.stackup_limits()
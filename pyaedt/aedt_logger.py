@@ -1,4 +1,5 @@
 import logging
+import os
 import sys
 
 from pyaedt import log_handler
@@ -79,10 +80,16 @@ class AedtLogger(object):
             self._global.addFilter(AppFilter())
 
         if filename:
-            self._file_handler = logging.FileHandler(filename)
-            self._file_handler.setLevel(level)
-            self._file_handler.setFormatter(FORMATTER)
-            self._global.addHandler(self._file_handler)
+            filename = os.path.abspath(filename)
+            for handler in self._global.handlers:
+                if isinstance(handler, logging.FileHandler) and handler.baseFilename == filename:
+                    self._file_handler = handler
+                    break
+            else:
+                self._file_handler = logging.FileHandler(filename)
+                self._file_handler.setLevel(level)
+                self._file_handler.setFormatter(FORMATTER)
+                self._global.addHandler(self._file_handler)
 
         if to_stdout:
             self._std_out_handler = logging.StreamHandler()
@@ -11,10 +11,11 @@ from __future__ import absolute_import
 import os
 import sys
 import traceback
+import csv
 import logging
-import pkgutil
 import getpass
 import re
+import signal
 import warnings
 import gc
 import time
@@ -27,6 +28,12 @@ if os.name == "posix":
         warnings.warn("Pythonnet is needed to run pyaedt within Linux")
 else:
     import subprocess
+try:
+    import psutil
+
+    psutil_available = True
+except ImportError:
+    psutil_available = False
 from pyaedt.application.MessageManager import AEDTMessageManager
 from pyaedt.misc import list_installed_ansysem
 from pyaedt import aedt_exception_handler
@@ -35,14 +42,14 @@ from pyaedt.generic.general_methods import is_ironpython, _pythonver, inside_des
 from pyaedt import aedt_logger
 
 pathname = os.path.dirname(__file__)
-if os.path.exists(os.path.join(pathname, "version.txt")):
-    with open(os.path.join(pathname, "version.txt"), "r") as f:
-        pyaedtversion = f.readline().strip()
-elif os.path.exists(os.path.join(pathname, "..", "version.txt")):
-    with open(os.path.join(pathname, "..", "version.txt"), "r") as f:
-        pyaedtversion = f.readline().strip()
-else:
-    pyaedtversion = "X"
+pyaedtversion = "X"
+for version_file in (os.path.join(pathname, "version.txt"), os.path.join(pathname, "..", "version.txt")):
+    try:
+        with open(version_file, "r") as f:
+            pyaedtversion = f.readline().strip()
+        break
+    except IOError:
+        pass
 
 
 if os.name == "nt":
@@ -50,26 +57,215 @@ if os.name == "nt":
 else:
     IsWindows = False
 logger = logging.getLogger(__name__)
+_LOG_FILE = None
 
-if is_ironpython:
-    import clr  # IronPython C:\Program Files\AnsysEM\AnsysEM19.4\Win64\common\IronPython\ipy64.exe
+_com = None
 
-    _com = "ironpython"
-elif IsWindows:
-    import pythoncom
 
-    modules = [tup[1] for tup in pkgutil.iter_modules()]
-    if "clr" in modules:
-        import clr
-        import win32com.client
+def _init_com():
+    """Detect the COM interface available and import its modules on first use.
 
-        _com = "pythonnet_v3"
-    elif "win32com" in modules:
-        import win32com.client
+    Importing ``clr``, ``pythoncom`` and ``win32com`` is expensive, so it is deferred until a
+    ``Desktop`` is actually initialized. The result is cached in the module.
+
+    Returns
+    -------
+    str
+        Name of the COM interface, such as ``"pythonnet_v3"``.
+
+    """
+    global _com, clr, pythoncom, win32com
+    if _com is not None:
+        return _com
+    if is_ironpython:
+        import clr  # IronPython C:\Program Files\AnsysEM\AnsysEM19.4\Win64\common\IronPython\ipy64.exe
+
+        _com = "ironpython"
+    elif IsWindows:
+        import pythoncom
+        from importlib.util import find_spec
+
+        if find_spec("clr") is not None:
+            import clr
+            import win32com.client
+
+            _com = "pythonnet_v3"
+        elif find_spec("win32com") is not None:
+            import win32com.client
+
+            _com = "pywin32"
+        else:
+            raise Exception("Error. No win32com.client or Pythonnet modules found. Please install them.")
+    return _com
+
+
+_CURRENT_USER = None
+
+
+def _get_user():
+    """Retrieve the name of the current user, looked up only on the first call."""
+    global _CURRENT_USER
+    if _CURRENT_USER is None:
+        _CURRENT_USER = getpass.getuser()
+    return _CURRENT_USER
+
+
+_INSTALLED_VERSIONS = None
+
+
+def _installed_versions():
+    """Retrieve the installed AEDT versions.
+
+    The environment variables are scanned and parsed only on the first call.
+
+    Returns
+    -------
+    list
+        List of ``(version_key, version_env_var)`` tuples, such as ``("2021.2", "ANSYSEM_ROOT212")``,
+        in the order returned by :func:`pyaedt.misc.list_installed_ansysem`.
+
+    """
+    global _INSTALLED_VERSIONS
+    if _INSTALLED_VERSIONS is not None:
+        return _INSTALLED_VERSIONS
+    _INSTALLED_VERSIONS = []
+    for version_env_var in list_installed_ansysem():
+        if "ANSYSEMSV_ROOT" in version_env_var:
+            current_version_id = version_env_var.replace("ANSYSEMSV_ROOT", "")
+            suffix = "SV"
+        else:
+            current_version_id = version_env_var.replace("ANSYSEM_ROOT", "")
+            suffix = ""
+        try:
+            version = int(current_version_id[0:2])
+            release = int(current_version_id[2])
+        except (ValueError, IndexError):
+            continue
+        if version < 20:
+            if release < 3:
+                version -= 1
+            else:
+                release -= 2
+        _INSTALLED_VERSIONS.append(("20{0}.{1}{2}".format(version, release, suffix), version_env_var))
+    return _INSTALLED_VERSIONS
+
+
+def _get_aedt_pids(process, username):
+    """Retrieve the IDs of the AEDT processes owned by a user with a single ``psutil`` scan.
+
+    Parameters
+    ----------
+    process : str
+        Name of the executable, such as ``"ansysedt.exe"``.
+    username : str
+        Name of the user owning the processes.
+
+    Returns
+    -------
+    set
+        Set of process IDs as strings.
+
+    """
+    process = process.lower()
+    username = username.lower()
+    pids = set()
+    for proc in psutil.process_iter(["name", "username"]):
+        name = proc.info["name"]
+        owner = proc.info["username"]
+        if not name or not owner or name.lower() != process:
+            continue
+        owner = owner.lower()
+        if owner == username or owner.endswith("\\" + username):
+            pids.add(str(proc.pid))
+    return pids
+
+
+def _kill_process(pid, timeout=2):
+    """Terminate a process and give it a chance to shut down cleanly before killing it.
+
+    Parameters
+    ----------
+    pid : int
+        ID of the process.
+    timeout : float, optional
+        Time in seconds to wait for the process to exit before killing it. The default is ``2``.
+
+    """
+    if psutil_available:
+        try:
+            proc = psutil.Process(pid)
+            proc.terminate()
+            proc.wait(timeout=timeout)
+        except psutil.TimeoutExpired:
+            try:
+                proc.kill()
+            except psutil.NoSuchProcess:
+                pass
+        except psutil.NoSuchProcess:
+            pass
+        return
+    try:
+        if IsWindows:
+            # Without psutil there is no way to wait for the process, and every signal maps to TerminateProcess.
+            os.kill(pid, 9)
+            return
+        os.kill(pid, signal.SIGTERM)
+    except OSError:
+        # The process has already exited.
+        return
+    if _wait_for_exit(pid, timeout):
+        return
+    try:
+        os.kill(pid, signal.SIGKILL)
+    except OSError:
+        # The process exited between the end of the wait and the kill.
+        pass
 
-        _com = "pywin32"
-    else:
-        raise Exception("Error. No win32com.client or Pythonnet modules found. Please install them.")
+
+def _wait_for_exit(pid, timeout):
+    """Wait for a POSIX process to exit.
+
+    Parameters
+    ----------
+    pid : int
+        ID of the process.
+    timeout : float
+        Maximum time in seconds to wait.
+
+    Returns
+    -------
+    bool
+        ``True`` when the process has exited, ``False`` when the timeout expired.
+
+    """
+    if hasattr(os, "pidfd_open"):
+        import select
+
+        try:
+            fd = os.pidfd_open(pid)
+        except OSError:
+            return True
+        try:
+            poller = select.poll()
+            poller.register(fd, select.POLLIN)
+            return bool(poller.poll(timeout * 1000))
+        finally:
+            os.close(fd)
+    deadline = time.time() + timeout
+    while True:
+        try:
+            os.kill(pid, 0)
+        except OSError:
+            return True
+        if time.time() >= deadline:
+            return False
+        time.sleep(0.05)
+
+
+def _format_first_frame(tb_data):
+    """Format only the outermost frame of a traceback."""
+    frame = traceback.extract_tb(tb_data, limit=1)
+    return "".join(traceback.format_list(frame)).rstrip("\n")
 
 
 def exception_to_desktop(ex_value, tb_data):
@@ -85,19 +281,15 @@ def exception_to_desktop(ex_value, tb_data):
         Traceback information.
 
     """
-    if "oMessenger" in dir(sys.modules["__main__"]):
-        messenger = sys.modules["__main__"].oMessenger
-        tb_trace = traceback.format_tb(tb_data)
-        tblist = tb_trace[0].split("\n")
+    tb_trace = _format_first_frame(tb_data)
+    main = sys.modules["__main__"]
+    if "oMessenger" in dir(main):
+        messenger = main.oMessenger
         messenger.add_error_message(str(ex_value), "Global")
-        for el in tblist:
-            messenger.add_error_message(el, "Global")
+        messenger.add_error_message(tb_trace, "Global")
     else:
-        tb_trace = traceback.format_tb(tb_data)
-        tblist = tb_trace[0].split("\n")
         warnings.warn(str(ex_value))
-        for el in tblist:
-            warnings.warn(el)
+        warnings.warn(tb_trace)
 
 
 def _delete_objects():
@@ -143,6 +335,14 @@ def _delete_objects():
     gc.collect()
 
 
+def _release_com_scopes(module, scope_id=5):
+    """Release the COM object scopes from ``0`` to ``scope_id`` included."""
+    com_util = module.COMUtil
+    api = com_util.PInvokeProxyAPI
+    for i in range(scope_id + 1):
+        com_util.ReleaseCOMObjectScope(api, i)
+
+
 def release_desktop(close_projects=True, close_desktop=True):
     """Release the AEDT API.
 
@@ -172,16 +372,12 @@ def release_desktop(close_projects=True, close_desktop=True):
                 desktop.CloseProject(project)
         pid = Module.oDesktop.GetProcessID()
         if not (is_ironpython and inside_desktop):
-            i = 0
-            scopeID = 5
-            while i <= scopeID:
-                Module.COMUtil.ReleaseCOMObjectScope(Module.COMUtil.PInvokeProxyAPI, i)
-                i += 1
+            _release_com_scopes(Module)
             _delete_objects()
 
         if close_desktop:
             try:
-                os.kill(pid, 9)
+                _kill_process(pid)
                 _delete_objects()
                 return True
             except:
@@ -209,11 +405,7 @@ def force_close_desktop():
         except:
             logger.warning("No Projects. Closing Desktop Connection")
         try:
-            i = 0
-            scopeID = 5
-            while i <= scopeID:
-                Module.COMUtil.ReleaseCOMObjectScope(Module.COMUtil.PInvokeProxyAPI, 0)
-                i += 1
+            _release_com_scopes(Module)
         except:
             logger.warning("No COM UTIL. Closing the Desktop....")
         try:
@@ -221,7 +413,7 @@ def force_close_desktop():
         except:
             pass
         try:
-            os.kill(pid, 9)
+            _kill_process(pid)
             del Module.oDesktop
             successfully_closed = True
         except:
@@ -253,7 +445,7 @@ def run_process(command, bufsize=None):
         return subprocess.call(command)
 
 
-class Desktop:
+class Desktop(object):
     """Initializes AEDT based on the inputs provided.
 
     .. note::
@@ -299,9 +491,23 @@ class Desktop:
     pyaedt info: No project is defined. Project...
     """
 
+    __slots__ = (
+        "_main",
+        "close_on_exit",
+        "releae_on_exit",
+        "logfile",
+        "_logger",
+        "odesktop",
+        "COMUtil",
+        "_version_keys",
+        "_version_ids",
+        "_install_path",
+    )
+
     def __init__(self, specified_version=None, non_graphical=False, new_desktop_session=True, close_on_exit=True,
                  student_version=False):
         """Initialize desktop."""
+        _init_com()
         self._main = sys.modules["__main__"]
         self._main.interpreter = _com
         self.close_on_exit = close_on_exit
@@ -318,6 +524,13 @@ class Desktop:
             self._main.oDesktop = oDesktop
         elif "oDesktop" in dir(self._main) and self._main.oDesktop is not None:
             self.releae_on_exit = False
+            if getattr(self._main, "pyaedt_initialized", False) and _LOG_FILE and "aedt_logger" in dir(self._main):
+                # Already attached to this session with the logger set up, so reuse it as is.
+                self.logfile = _LOG_FILE
+                self._logger = self._main.aedt_logger
+                self._set_install_path()
+                self.odesktop = self._main.oDesktop
+                return
         else:
             if "oDesktop" in dir(self._main):
                 del self._main.oDesktop
@@ -351,44 +564,21 @@ class Desktop:
     @property
     def install_path(self):
         """Installation path for AEDT."""
-        version_key = self._main.AEDTVersion
-        root = self._version_ids[version_key]
-        return os.environ[root]
+        return self._install_path
 
     @property
     def version_keys(self):
         """Version keys for AEDT."""
-
-        self._version_keys = []
-        self._version_ids = {}
-        version_list = list_installed_ansysem()
-        for version_env_var in version_list:
-            if "ANSYSEMSV_ROOT" in version_env_var:
-                current_version_id = version_env_var.replace("ANSYSEMSV_ROOT", "")
-                student = True
-            else:
-                current_version_id = version_env_var.replace("ANSYSEM_ROOT", "")
-                student = False
-            try:
-                version = int(current_version_id[0:2])
-                release = int(current_version_id[2])
-                if version < 20:
-                    if release < 3:
-                        version -= 1
-                    else:
-                        release -= 2
-                if student:
-                    v_key = "20{0}.{1}SV".format(version, release)
-                    self._version_keys.append(v_key)
-                    self._version_ids[v_key] = version_env_var
-                else:
-                    v_key = "20{0}.{1}".format(version, release)
-                    self._version_keys.append(v_key)
-                    self._version_ids[v_key] = version_env_var
-            except:
-                pass
+        if not hasattr(self, "_version_keys"):
+            self._compute_version_keys()
         return self._version_keys
 
+    def _compute_version_keys(self):
+        """Store the keys and environment variables of the installed AEDT versions."""
+        installed_versions = _installed_versions()
+        self._version_keys = [v_key for v_key, _ in installed_versions]
+        self._version_ids = dict(installed_versions)
+
     @property
     def current_version(self):
         """Current version of AEDT."""
@@ -410,8 +600,16 @@ class Desktop:
         self._logger.info("Logger Started on %s", self.logfile)
         self._main.aedt_logger = self._logger
         self._main.sDesktopinstallDirectory = self._main.oDesktop.GetExeDir()
+        self._set_install_path()
         self._main.pyaedt_initialized = True
 
+    def _set_install_path(self):
+        if not hasattr(self, "_version_ids"):
+            self._compute_version_keys()
+        self._install_path = os.environ.get(
+            self._version_ids.get(self._main.AEDTVersion, ""), self._main.sDesktopinstallDirectory
+        )
+
     def _set_version(self, specified_version, student_version):
         version_student = False
         if specified_version:
@@ -455,21 +653,33 @@ class Desktop:
         return True
 
     def _get_tasks_list_windows(self, student_version):
-        processID2 = []
-        username = getpass.getuser()
+        processID2 = set()
+        username = _get_user()
         if student_version:
             process = "ansysedtsv.exe"
         else:
             process = "ansysedt.exe"
-        with os.popen('tasklist /FI "IMAGENAME eq {}" /v'.format(process)) as tasks_list:
+        if psutil_available:
+            return _get_aedt_pids(process, username)
+        with os.popen('tasklist /FI "IMAGENAME eq {}" /FO CSV /NH /v'.format(process)) as tasks_list:
             output = tasks_list.readlines()
-        pattern = r"(?i)^(?:{})\s+?(\d+)\s+.+[\s|\\](?:{})\s+".format(process, username)
-        for l in output:
-            m = re.search(pattern, l)
-            if m:
-                processID2.append(m.group(1))
+        username = username.lower()
+        for row in csv.reader(output):
+            if len(row) < 7 or row[0].lower() != process:
+                continue
+            user = row[6].lower()
+            if user == username or user.endswith("\\" + username):
+                processID2.add(row[1])
         return processID2
 
+    @staticmethod
+    def _get_app_process_id(o_ansoft_app):
+        # Retrieve the process ID from the application returned by CreateObjectNew, if it is usable.
+        try:
+            return str(o_ansoft_app.GetAppDesktop().GetProcessID())
+        except:
+            return None
+
     def _run_student(self):
 
         DETACHED_PROCESS = 0x00000008
@@ -496,25 +706,32 @@ class Desktop:
         self._main.COMUtil = self.COMUtil
         StandalonePyScriptWrapper = AnsoftCOMUtil.Ansoft.CoreCOMScripting.COM.StandalonePyScriptWrapper
         print("pyaedt info: Launching AEDT with module Pythonnet.")
-        processID = []
+        processID = set()
         if IsWindows:
             processID = self._get_tasks_list_windows(student_version)
+        new_pid = None
         if student_version and not processID:
             self._run_student()
         elif non_graphical or new_aedt_session or not processID:
             # Force new object if no non-graphical instance is running or if there is not an already existing process.
-            StandalonePyScriptWrapper.CreateObjectNew(non_graphical)
+            o_ansoft_app = StandalonePyScriptWrapper.CreateObjectNew(non_graphical)
+            new_pid = self._get_app_process_id(o_ansoft_app)
         else:
             StandalonePyScriptWrapper.CreateObject(version)
         if non_graphical:
             os.environ["PYAEDT_DESKTOP_LOGS"] = "False"
-        processID2 = []
-        if IsWindows:
-            processID2 = self._get_tasks_list_windows(student_version)
-        proc = [i for i in processID2 if i not in processID]
-        if not proc:
-            proc = processID2
-        if proc == processID2 and len(processID2) > 1:
+        if new_pid:
+            # The new session reported its own process ID, so no need to list the processes again.
+            proc = [new_pid]
+            processID2 = set(proc)
+        else:
+            processID2 = set()
+            if IsWindows:
+                processID2 = self._get_tasks_list_windows(student_version)
+            proc = list(processID2 - processID)
+            if not proc:
+                proc = list(processID2)
+        if len(proc) == len(processID2) > 1:
             self._dispatch_win32(version)
         elif version_key >= "2021.2":
             if student_version:
@@ -524,8 +741,13 @@ class Desktop:
             context = pythoncom.CreateBindCtx(0)
             running_coms = pythoncom.GetRunningObjectTable()
             monikiers = running_coms.EnumRunning()
+            needle = ":" + str(proc[0])
+            ver_re = re.compile(re.escape(version[10:]) + r"\.\d:" + re.escape(str(proc[0])))
             for monikier in monikiers:
-                m = re.search(version[10:] + r"\.\d:" + str(proc[0]), monikier.GetDisplayName(context, monikier))
+                name = monikier.GetDisplayName(context, monikier)
+                if needle not in name:
+                    continue
+                m = ver_re.search(name)
                 if m:
                     obj = running_coms.GetObject(monikier)
                     self._main.isoutsideDesktop = True
@@ -538,7 +760,11 @@ class Desktop:
             self._dispatch_win32(version)
 
     def _set_logger_file(self):
-        # Set up the log file in the AEDT project directory
+        # Set up the log file in the AEDT project directory once per interpreter
+        global _LOG_FILE
+        if _LOG_FILE:
+            self.logfile = _LOG_FILE
+            return True
         if "oDesktop" in dir(self._main):
             project_dir = self._main.oDesktop.GetProjectDirectory()
         else:
@@ -546,6 +772,7 @@ class Desktop:
         self.logfile = os.path.join(
             project_dir, "pyaedt{}.log".format(datetime.datetime.now().strftime("%Y%m%d_%H%M%S"))
         )
+        _LOG_FILE = self.logfile
 
         return True
 
@@ -846,11 +1073,8 @@ class Desktop:
             Type of the exception.
 
         """
-        tb_trace = traceback.format_tb(tb_data)
-        tblist = tb_trace[0].split("\n")
-        self.logger.error(str(ex_value), "Global")
-        for el in tblist:
-            self.logger.error(el, "Global")
+        self.logger.error(str(ex_value))
+        self.logger.error(_format_first_frame(tb_data))
 
         return str(ex_value)
 
@@ -881,9 +1105,9 @@ class Desktop:
 
         """
         result = release_desktop(close_projects, close_on_exit)
-        props = [a for a in dir(self) if not a.startswith("__")]
-        for a in props:
-            self.__dict__.pop(a, None)
+        for a in self.__slots__:
+            if hasattr(self, a):
+                delattr(self, a)
         gc.collect()
         return result
 
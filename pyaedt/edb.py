@@ -616,14 +616,13 @@ class Edb(object):
 
         pins = []
         if self.core_components:
-            for el in self.core_components.components:
-                comp = self.edb.Cell.Hierarchy.Component.FindByName(self.active_layout, el)
-                temp = [
+            padstack_instance_type = self.edb.Cell.LayoutObjType.PadstackInstance
+            for comp in self.core_components.components.values():
+                pins += [
                     p
-                    for p in comp.LayoutObjs
-                    if p.GetObjType() == self.edb.Cell.LayoutObjType.PadstackInstance and p.IsLayoutPin()
+                    for p in comp.edbcomponent.LayoutObjs
+                    if p.GetObjType() == padstack_instance_type and p.IsLayoutPin()
                 ]
-                pins += temp
         return pins
 
     class Boundaries:
@@ -1442,9 +1442,16 @@ class EDBComponent(object):
 
     """
 
+    _TYPES = {0: "Other", 1: "Resistor", 2: "Inductor", 3: "Capacitor", 4: "IC", 5: "IO"}
+
     def __init__(self, components, cmp):
         self._pcomponents = components
         self.edbcomponent = cmp
+        # Read once the properties used to sort components, they do not change for a given component.
+        self._type = self._TYPES.get(int(cmp.GetComponentType()))
+        self._numpins = cmp.GetNumberOfPins()
+        self._partname = cmp.GetComponentDef().GetName()
+        self._nets = None
 
     @property
     def refdes(self):
@@ -1542,8 +1549,9 @@ class EDBComponent(object):
         list
             List of Pins of Component.
         """
+        padstack_instance_type = self._edb.Cell.LayoutObjType.PadstackInstance
         pins = [p for p in self.edbcomponent.LayoutObjs if
-                p.GetObjType() == self._edb.Cell.LayoutObjType.PadstackInstance and p.IsLayoutPin()]
+                p.GetObjType() == padstack_instance_type and p.IsLayoutPin()]
         return pins
 
     @property
@@ -1555,10 +1563,13 @@ class EDBComponent(object):
         list
             List of Nets of Component.
         """
-        netlist = []
-        for pin in self.pinlist:
-            netlist.append(pin.GetNet().GetName())
-        return list(set(netlist))
+        if self._nets is None:
+            self._nets = list(set(pin.GetNet().GetName() for pin in self.pinlist))
+        return list(self._nets)
+
+    def _reset_nets(self):
+        """Forget the cached nets so that they are read again from the pins on next access."""
+        self._nets = None
 
     @property
     def pins(self):
@@ -1583,19 +1594,7 @@ class EDBComponent(object):
         str
             Component type.
         """
-        cmp_type = int(self.edbcomponent.GetComponentType())
-        if cmp_type == 1:
-            return "Resistor"
-        elif cmp_type == 2:
-            return "Inductor"
-        elif cmp_type == 3:
-            return "Capacitor"
-        elif cmp_type == 4:
-            return "IC"
-        elif cmp_type == 5:
-            return "IO"
-        elif cmp_type == 0:
-            return "Other"
+        return self._type
 
     @property
     def numpins(self):
@@ -1606,7 +1605,7 @@ class EDBComponent(object):
         int
             Number of Pins of Component.
         """
-        return self.edbcomponent.GetNumberOfPins()
+        return self._numpins
 
     @property
     def partname(self):
@@ -1617,7 +1616,7 @@ class EDBComponent(object):
         str
             Component Part Name.
         """
-        return self.edbcomponent.GetComponentDef().GetName()
+        return self._partname
 
     @property
     def _edb_value(self):
@@ -1,8 +1,10 @@
 """This module contains the `Components` class.
 
 """
+import csv
 import re
 import warnings
+from collections import defaultdict
 
 from pyaedt import generate_unique_name, _retry_ntimes
 from pyaedt.edb_core.general import convert_py_list_to_net_list
@@ -19,6 +21,14 @@ except ImportError:
     warnings.warn("This module requires PythonNet.")
 
 
+_RVALUE_PATTERN = re.compile(r"\s+|meg|[Oo]hm|k|m|M")
+_RVALUE_MAP = {"meg": "e6", "k": "e3", "m": "e-3", "M": "e6"}
+
+
+def _rvalue_repl(match):
+    return _RVALUE_MAP.get(match.group(0), "")
+
+
 def resistor_value_parser(RValue):
     """Convert a resistor value.
 
@@ -33,16 +43,25 @@ def resistor_value_parser(RValue):
         Resistor value.
 
     """
-    if isinstance(RValue, str):
-        RValue = RValue.replace(" ", "")
-        RValue = RValue.replace("meg", "m")
-        RValue = RValue.replace("Ohm", "")
-        RValue = RValue.replace("ohm", "")
-        RValue = RValue.replace("k", "e3")
-        RValue = RValue.replace("m", "e-3")
-        RValue = RValue.replace("M", "e6")
-    RValue = float(RValue)
-    return RValue
+    if not isinstance(RValue, str):
+        return float(RValue)
+    try:
+        # Most values have no unit or suffix and need no substitution.
+        return float(RValue)
+    except ValueError:
+        return float(_RVALUE_PATTERN.sub(_rvalue_repl, RValue))
+
+
+class _ComponentPins(object):
+    """Pins of a component with the lookups derived from them, which are computed on first use."""
+
+    __slots__ = ("pins", "net_names", "by_net", "by_name")
+
+    def __init__(self, pins):
+        self.pins = pins
+        self.net_names = None
+        self.by_net = None
+        self.by_name = None
 
 
 class Components(object):
@@ -59,18 +78,19 @@ class Components(object):
     >>> edbapp.core_components
     """
 
+    _RLC_TYPES = frozenset(("Resistor", "Capacitor", "Inductor"))
+    # Checked in order against the lowercase BOM component type.
+    _BOM_RLC_KEYWORDS = (("resistor", "res_value"), ("capacitor", "cap_value"), ("inductor", "ind_value"))
+
     def __init__(self, p_edb):
         self._pedb = p_edb
         self._cmp = {}
-        self._res = {}
-        self._cap = {}
-        self._ind = {}
-        self._ios = {}
-        self._ics = {}
-        self._others = {}
-        self._pins = {}
-        self._comps_by_part = {}
-        self._init_parts()
+        self._category_cache = None
+        self._net_to_refdes = None
+        self._pins_by_cmp = {}
+        self._net_conn_cache = {}
+        self._res_values = {}
+        self._two_pin_resistors = None
 
     @property
     def _logger(self):
@@ -83,13 +103,8 @@ class Components(object):
 
     @aedt_exception_handler
     def _init_parts(self):
-        a = self.components
-        a = self.resistors
-        a = self.ICs
-        a = self.Others
-        a = self.inductors
-        a = self.IOs
-        a = self.components_by_partname
+        # Components and categories are computed on first access. Call this only to load them upfront.
+        self._build_categories()
         return True
 
     @property
@@ -146,11 +161,85 @@ class Components(object):
         """Refresh the component dictionary.
         """
         self._cmp = {}
+        self._clear_caches()
         self._logger.info("Refreshing the Components dictionary.")
         if self._active_layout:
-            for cmp in self._active_layout.Groups:
-                if cmp.GetType().ToString() == "Ansys.Ansoft.Edb.Cell.Hierarchy.Component":
-                    self._cmp[cmp.GetName()] = EDBComponent(self, cmp)
+            self._cmp = {
+                cmp.GetName(): EDBComponent(self, cmp)
+                for cmp in self._active_layout.Groups
+                if cmp.GetType().ToString() == "Ansys.Ansoft.Edb.Cell.Hierarchy.Component"
+            }
+
+    def _clear_caches(self):
+        """Clear the data derived from the components dictionary."""
+        for comp in self._cmp.values():
+            comp._reset_nets()
+        self._category_cache = None
+        self._net_to_refdes = None
+        self._pins_by_cmp = {}
+        self._net_conn_cache = {}
+        self._res_values = {}
+        self._two_pin_resistors = None
+
+    def _clear_rlc_value(self, name):
+        """Drop the cached resistor value of a component whose RLC model is modified."""
+        self._res_values.pop(name, None)
+        self._two_pin_resistors = None
+
+    def clear_cache(self):
+        """Clear the cached pin and net connection data of the components.
+
+        The cache is cleared automatically when components are created or deleted
+        through this class. Call this method after editing the layout by other means.
+
+        Returns
+        -------
+        bool
+            ``True`` when successful.
+
+        Examples
+        --------
+
+        >>> from pyaedt import Edb
+        >>> edbapp = Edb("myaedbfolder")
+        >>> edbapp.core_components.clear_cache()
+
+        """
+        self._clear_caches()
+        return True
+
+    def _build_net_index(self):
+        """Map each net name to the reference designators of the components connected to it."""
+        net_to_refdes = {}
+        for refdes, val in self.components.items():
+            for net in val.nets:
+                net_to_refdes.setdefault(net, []).append(refdes)
+        self._net_to_refdes = net_to_refdes
+        return net_to_refdes
+
+    def _build_categories(self):
+        """Sort the components by type and by part name in a single pass.
+
+        The result is cached until the components are modified.
+        """
+        categories = {"Resistor": {}, "Capacitor": {}, "Inductor": {}, "IC": {}, "IO": {}, "Other": {}}
+        by_partname = defaultdict(list)
+        for el, val in self.components.items():
+            cmp_type = val.type
+            if cmp_type in categories:
+                categories[cmp_type][el] = val
+            by_partname[val.partname].append(val)
+        categories["partname"] = dict(by_partname)
+        self._category_cache = categories
+        return categories
+
+    def _get_category(self, name):
+        if self._category_cache is None:
+            self._build_categories()
+        # Return copies so that callers modifying the result do not alter the cache.
+        if name == "partname":
+            return {partname: list(comps) for partname, comps in self._category_cache[name].items()}
+        return dict(self._category_cache[name])
 
     @property
     def resistors(self):
@@ -168,11 +257,7 @@ class Components(object):
         >>> edbapp = Edb("myaedbfolder")
         >>> edbapp.core_components.resistors
         """
-        self._res = {}
-        for el, val in self.components.items():
-            if val.type == "Resistor":
-                self._res[el] = val
-        return self._res
+        return self._get_category("Resistor")
 
     @property
     def capacitors(self):
@@ -190,11 +275,7 @@ class Components(object):
         >>> edbapp = Edb("myaedbfolder")
         >>> edbapp.core_components.capacitors
         """
-        self._cap = {}
-        for el, val in self.components.items():
-            if val.type == "Capacitor":
-                self._cap[el] = val
-        return self._cap
+        return self._get_category("Capacitor")
 
     @property
     def inductors(self):
@@ -213,11 +294,7 @@ class Components(object):
         >>> edbapp.core_components.inductors
 
         """
-        self._ind = {}
-        for el, val in self.components.items():
-            if val.type == "Inductor":
-                self._ind[el] = val
-        return self._ind
+        return self._get_category("Inductor")
 
     @property
     def ICs(self):
@@ -236,11 +313,7 @@ class Components(object):
         >>> edbapp.core_components.ICs
 
         """
-        self._ics = {}
-        for el, val in self.components.items():
-            if val.type == "IC":
-                self._ics[el] = val
-        return self._ics
+        return self._get_category("IC")
 
     @property
     def IOs(self):
@@ -259,11 +332,7 @@ class Components(object):
         >>> edbapp.core_components.IOs
 
         """
-        self._ios = {}
-        for el, val in self.components.items():
-            if val.type == "IO":
-                self._ios[el] = val
-        return self._ios
+        return self._get_category("IO")
 
     @property
     def Others(self):
@@ -285,11 +354,7 @@ class Components(object):
         >>> edbapp.core_components.others
 
         """
-        self._others = {}
-        for el, val in self.components.items():
-            if val.type == "Other":
-                self._others[el] = val
-        return self._others
+        return self._get_category("Other")
 
     @property
     def components_by_partname(self):
@@ -308,13 +373,7 @@ class Components(object):
         >>> edbapp.core_components.components_by_partname
 
         """
-        self._comps_by_part = {}
-        for el, val in self.components.items():
-            if val.partname in self._comps_by_part.keys():
-                self._comps_by_part[val.partname].append(val)
-            else:
-                self._comps_by_part[val.partname] = [val]
-        return self._comps_by_part
+        return self._get_category("partname")
 
     @aedt_exception_handler
     def get_component_list(self):
@@ -326,11 +385,7 @@ class Components(object):
             List of component setup information.
 
         """
-        cmp_setup_info_list = self._edbutils.ComponentSetupInfo.GetFromLayout(self._active_layout)
-        cmp_list = []
-        for comp in cmp_setup_info_list:
-            cmp_list.append(comp)
-        return cmp_list
+        return list(self._edbutils.ComponentSetupInfo.GetFromLayout(self._active_layout))
 
     @aedt_exception_handler
     def get_component_by_name(self, name):
@@ -347,6 +402,9 @@ class Components(object):
             ``True`` when successful, ``False`` when failed.
 
         """
+        if name in self._cmp:
+            # Reuse the EDB object already held by the components dictionary.
+            return self._cmp[name].edbcomponent
         edbcmp = self._edb.Cell.Hierarchy.Component.FindByName(self._active_layout, name)
         if edbcmp is not None:
             return edbcmp
@@ -368,15 +426,15 @@ class Components(object):
             List of components that belong to the signal nets.
 
         """
-        cmp_list = []
         if isinstance(netlist, str):
             netlist = [netlist]
-        components = list(self.components.keys())
-        for refdes in components:
-            cmpnets = self._cmp[refdes].nets
-            if set(cmpnets).intersection(set(netlist)):
-                cmp_list.append(refdes)
-        return cmp_list
+        if self._net_to_refdes is None:
+            self._build_net_index()
+        found = set()
+        for net in netlist:
+            found.update(self._net_to_refdes.get(net, ()))
+        # Return the components in the same order as the components dictionary.
+        return [refdes for refdes in self.components if refdes in found]
 
     @aedt_exception_handler
     def create_component_from_pins(self, pins, component_name, placement_layer=None):
@@ -409,10 +467,12 @@ class Components(object):
             new_cmp = self._edb.Cell.Hierarchy.Component.Create(self._active_layout, component_name, component_name)
             new_group = self._edb.Cell.Hierarchy.Group.Create(self._active_layout, component_name)
             new_cmp.SetGroup(new_group)
+            pin_to_connectable = self._components_methods.PinToConnectable
+            add_member = new_group.AddMember
             for pin in pins:
                 pin.SetIsLayoutPin(True)
-                conv_pin = self._components_methods.PinToConnectable(pin)
-                add_result = new_group.AddMember(conv_pin)
+                conv_pin = pin_to_connectable(pin)
+                add_result = add_member(conv_pin)
             #new_cmp.SetGroup(new_group)
             if not placement_layer:
                 new_cmp_layer_name = pins[0].GetPadstackDef().GetData().GetLayerNames()[0]
@@ -424,6 +484,9 @@ class Components(object):
             new_cmp.SetPlacementLayer(new_cmp_placement_layer)
             #cmp_transform = System.Activator.CreateInstance(self._edb.Utility.)
             #new_cmp.SetTransform(cmp_transform)
+            self._clear_caches()
+            if self._cmp:
+                self._cmp[component_name] = EDBComponent(self, new_cmp)
             return (True, new_cmp)
         except:
             return (False, None)
@@ -461,6 +524,7 @@ class Components(object):
         """
         if not modelname:
             modelname = get_filename_without_extension(modelpath)
+        self._clear_rlc_value(componentname)
         edbComponent = self.get_component_by_name(componentname)
         if str(edbComponent.EDBHandle) == "0":
             return False
@@ -470,21 +534,19 @@ class Components(object):
         componentNets = self.get_nets_from_pin_list(componentPins)
         pinNumber = len(componentPins)
         if model_type == "Spice":
+            pinNames = []
             with open(modelpath, "r") as f:
                 for line in f:
-                    if "subckt" in line.lower():
-                        pinNames = [i.strip() for i in re.split(" |\t", line) if i]
-                        pinNames.remove(pinNames[0])
-                        pinNames.remove(pinNames[0])
+                    if line.lstrip()[:7].lower() == ".subckt":
+                        pinNames = line.split()[2:]
                         break
             if len(pinNames) == pinNumber:
                 spiceMod = self._edb.Cell.Hierarchy.SPICEModel()
                 spiceMod.SetModelPath(modelpath)
                 spiceMod.SetModelName(modelname)
-                terminal = 1
-                for pn in pinNames:
-                    spiceMod.AddTerminalPinPair(pn, str(terminal))
-                    terminal += 1
+                add_terminal_pin_pair = spiceMod.AddTerminalPinPair
+                for terminal, pn in enumerate(pinNames, 1):
+                    add_terminal_pin_pair(pn, str(terminal))
 
                 edbRlcComponentProperty.SetModel(spiceMod)
                 if not edbComponent.SetComponentProperty(edbRlcComponentProperty):
@@ -506,12 +568,8 @@ class Components(object):
 
             sParameterMod = self._edb.Cell.Hierarchy.SParameterModel()
             sParameterMod.SetComponentModelName(nPortModel)
-            gndnets = filter(lambda x: "gnd" in x.lower(), componentNets)
-            if len(gndnets) > 0:
-
-                net = gndnets[0]
-            else:
-                net = componentNets[len(componentNets) - 1]
+            # Use the first ground net as reference, or the last net when there is none.
+            net = next((n for n in componentNets if "gnd" in n.lower()), componentNets[-1] if componentNets else None)
             sParameterMod.SetReferenceNet(net)
             edbRlcComponentProperty.SetModel(sParameterMod)
             if not edbComponent.SetComponentProperty(edbRlcComponentProperty):
@@ -583,14 +641,13 @@ class Components(object):
         """
         deleted_comps = []
         for comp, val in self.components.items():
-            if val.numpins < 2 and (val.type == "Resistor" or val.type == "Capacitor" or val.type == "Inductor"):
-                edb_cmp = self.get_component_by_name(comp)
-                if edb_cmp is not None:
-                    edb_cmp.Delete()
-                    deleted_comps.append(comp)
-                    self._pedb._logger.info("Component {} deleted".format(comp))
+            if val.numpins < 2 and val.type in self._RLC_TYPES:
+                val.edbcomponent.Delete()
+                deleted_comps.append(comp)
+                self._pedb._logger.info("Component {} deleted".format(comp))
         for el in deleted_comps:
-            del self.components[el]
+            self._cmp.pop(el, None)
+        self._clear_caches()
         return deleted_comps
 
     @aedt_exception_handler
@@ -618,8 +675,8 @@ class Components(object):
         edb_cmp = self.get_component_by_name(component_name)
         if edb_cmp is not None:
             edb_cmp.Delete()
-            if edb_cmp in list(self.components.keys()):
-                del self.components[edb_cmp]
+            self._cmp.pop(component_name, None)
+            self._clear_caches()
             return True
         return False
 
@@ -645,6 +702,7 @@ class Components(object):
         >>> edbapp.core_components.disable_rlc_component("A1")
 
         """
+        self._clear_rlc_value(component_name)
         edb_cmp = self.get_component_by_name(component_name)
         if edb_cmp is not None:
             rlc_property = edb_cmp.GetComponentProperty().Clone()
@@ -758,29 +816,33 @@ class Components(object):
         ... )
 
         """
+        if res_value is None and ind_value is None and cap_value is None:
+            return False
+        self._clear_rlc_value(componentname)
         edbComponent = self.get_component_by_name(componentname)
-        componentType = edbComponent.GetComponentType()
-        edbRlcComponentProperty = self._edb.Cell.Hierarchy.RLCComponentProperty()
         componentPins = self.get_pin_from_component(componentname)
         pinNumber = len(componentPins)
         if pinNumber == 2:
             fromPin = componentPins[0]
             toPin = componentPins[1]
-            if res_value is None and ind_value is None and cap_value is None:
-                return False
-            rlc = self._edb.Utility.Rlc()
+            # Resolve the EDB namespaces and the value converter once for all the objects created below.
+            edb_hierarchy = self._edb.Cell.Hierarchy
+            edb_utility = self._edb.Utility
+            edb_value = self._edb_value
+            edbRlcComponentProperty = edb_hierarchy.RLCComponentProperty()
+            rlc = edb_utility.Rlc()
             rlc.IsParallel = isparallel
             if res_value is not None:
                 rlc.REnabled = True
-                rlc.R = self._edb_value(res_value)
+                rlc.R = edb_value(res_value)
             if ind_value is not None:
                 rlc.LEnabled = True
-                rlc.L = self._edb_value(ind_value)
+                rlc.L = edb_value(ind_value)
             if cap_value is not None:
                 rlc.CEnabled = True
-                rlc.C = self._edb_value(cap_value)
-            pinPair = self._edb.Utility.PinPair(fromPin.GetName(), toPin.GetName())
-            rlcModel = self._edb.Cell.Hierarchy.PinPairModel()
+                rlc.C = edb_value(cap_value)
+            pinPair = edb_utility.PinPair(fromPin.GetName(), toPin.GetName())
+            rlcModel = edb_hierarchy.PinPairModel()
             rlcModel.SetPinPairRlc(pinPair, rlc)
             if not edbRlcComponentProperty.SetModel(rlcModel) or not edbComponent.SetComponentProperty(
                 edbRlcComponentProperty
@@ -829,30 +891,46 @@ class Components(object):
 
         """
         with open(bom_file, "r") as f:
-            Lines = f.readlines()
             found = False
             refdescolumn = None
             comptypecolumn = None
             valuecolumn = None
-            for line in Lines:
-                content_line = [i.strip() for i in line.split(delimiter)]
-                if valuefield in content_line:
-                    valuecolumn = content_line.index(valuefield)
-                if comptype in content_line:
-                    comptypecolumn = content_line.index(comptype)
-                if refdes in content_line:
-                    refdescolumn = content_line.index(refdes)
-                elif refdescolumn:
-                    found = True
-                    new_refdes = content_line[refdescolumn].split(" ")[0]
-                    new_value = content_line[valuecolumn].split(" ")[0]
-                    new_type = content_line[comptypecolumn]
-                    if "resistor" in new_type.lower():
-                        self.set_component_rlc(new_refdes, res_value=new_value)
-                    elif "capacitor" in new_type.lower():
-                        self.set_component_rlc(new_refdes, cap_value=new_value)
-                    elif "inductor" in new_type.lower():
-                        self.set_component_rlc(new_refdes, ind_value=new_value)
+            bom_values = {}
+            if len(delimiter) == 1:
+                rows = csv.reader(f, delimiter=delimiter)
+            else:
+                # The csv module supports only single-character delimiters.
+                rows = (line.rstrip("\r\n").split(delimiter) for line in f)
+            for row in rows:
+                content_line = [i.strip() for i in row]
+                if not any(content_line):
+                    continue
+                if refdescolumn is None:
+                    # Header row: resolve the column indexes once.
+                    if refdes in content_line:
+                        refdescolumn = content_line.index(refdes)
+                        if valuefield in content_line:
+                            valuecolumn = content_line.index(valuefield)
+                        if comptype in content_line:
+                            comptypecolumn = content_line.index(comptype)
+                    continue
+                found = True
+                new_refdes = content_line[refdescolumn].split(" ")[0]
+                new_value = content_line[valuecolumn].split(" ")[0]
+                new_type = content_line[comptypecolumn]
+                # Duplicated reference designators are assigned once, with the last value found.
+                bom_values[new_refdes] = (new_type, new_value)
+        value_keywords = {}
+        for new_refdes, (new_type, new_value) in bom_values.items():
+            # BOM types repeat a lot, so match each distinct type against the RLC kinds only once.
+            if new_type not in value_keywords:
+                lower_type = new_type.lower()
+                value_keywords[new_type] = next(
+                    (kw for kind, kw in self._BOM_RLC_KEYWORDS if kind in lower_type), None
+                )
+            keyword = value_keywords[new_type]
+            if keyword:
+                self.set_component_rlc(new_refdes, **{keyword: new_value})
         return found
 
     @aedt_exception_handler
@@ -883,31 +961,56 @@ class Components(object):
         >>> edbapp.core_components.get_pin_from_component("R1", refdes)
 
         """
-
-        cmp = self._edb.Cell.Hierarchy.Component.FindByName(self._active_layout, cmpName)
+        cmp_pins = self._get_component_pins(cmpName)
         if netName:
-            pins = [
-                p
-                for p in cmp.LayoutObjs
-                if p.GetObjType() == self._edb.Cell.LayoutObjType.PadstackInstance
-                and p.IsLayoutPin()
-                and p.GetNet().GetName() == netName
-            ]
+            if cmp_pins.by_net is None:
+                by_net = {}
+                for p, net_name in zip(cmp_pins.pins, self._get_pin_net_names(cmp_pins)):
+                    by_net.setdefault(net_name, []).append(p)
+                cmp_pins.by_net = by_net
+            return list(cmp_pins.by_net.get(netName, []))
         elif pinName:
-            pins = [
-                p
-                for p in cmp.LayoutObjs
-                if p.GetObjType() == self._edb.Cell.LayoutObjType.PadstackInstance
-                and p.IsLayoutPin()
-                and (self.get_aedt_pin_name(p) == str(pinName) or p.GetName() == str(pinName))
-            ]
-        else:
-            pins = [
-                p
-                for p in cmp.LayoutObjs
-                if p.GetObjType() == self._edb.Cell.LayoutObjType.PadstackInstance and p.IsLayoutPin()
-            ]
-        return pins
+            if cmp_pins.by_name is None:
+                by_name = {}
+                for p in cmp_pins.pins:
+                    for name in {self.get_aedt_pin_name(p), p.GetName()}:
+                        by_name.setdefault(name, []).append(p)
+                cmp_pins.by_name = by_name
+            return list(cmp_pins.by_name.get(str(pinName), []))
+        return list(cmp_pins.pins)
+
+    def _get_component_pins(self, cmpName):
+        """Retrieve the cached pins of a component.
+
+        The pins are cached until the components are modified and must not be modified by the caller.
+
+        Parameters
+        ----------
+        cmpName : str
+            Name of the component.
+
+        Returns
+        -------
+        :class:`pyaedt.edb_core.components._ComponentPins`
+        """
+        cmp_pins = self._pins_by_cmp.get(cmpName)
+        if cmp_pins is None:
+            cmp = self.get_component_by_name(cmpName)
+            padstack_instance_type = self._edb.Cell.LayoutObjType.PadstackInstance
+            cmp_pins = _ComponentPins(
+                [p for p in cmp.LayoutObjs if p.GetObjType() == padstack_instance_type and p.IsLayoutPin()]
+            )
+            self._pins_by_cmp[cmpName] = cmp_pins
+        return cmp_pins
+
+    def _get_pin_net_names(self, cmp_pins):
+        """Retrieve the net names of the pins of a component, in the same order as the pins.
+
+        Many pins share the same net, so the names are read once and reused by all the pin queries.
+        """
+        if cmp_pins.net_names is None:
+            cmp_pins.net_names = [net_name for _, net_name in self._pin_nets(cmp_pins.pins)]
+        return cmp_pins.net_names
 
     @aedt_exception_handler
     def get_aedt_pin_name(self, pin):
@@ -980,6 +1083,21 @@ class Components(object):
         )
         return [pin_xy.X.ToDouble(), pin_xy.Y.ToDouble()]
 
+    def _pin_nets(self, pin_list):
+        """Pair each pin with the name of its net in a single traversal.
+
+        Parameters
+        ----------
+        pin_list : list
+            List of EDB core pins.
+
+        Returns
+        -------
+        list
+            List of ``(pin, net_name)`` tuples.
+        """
+        return [(pin, pin.GetNet().GetName()) for pin in pin_list]
+
     @aedt_exception_handler
     def get_pins_name_from_net(self, pin_list, net_name):
         """Retrieve pins belonging to a net.
@@ -1004,11 +1122,7 @@ class Components(object):
         >>> edbapp.core_components.get_pins_name_from_net(pin_list, net_name)
 
         """
-        pinlist = []
-        for pin in pin_list:
-            if pin.GetNet().GetName() == net_name:
-                pinlist.append(pin.GetName())
-        return pinlist
+        return [pin.GetName() for pin, pin_net in self._pin_nets(pin_list) if pin_net == net_name]
 
     @aedt_exception_handler
     def get_nets_from_pin_list(self, PinList):
@@ -1032,10 +1146,7 @@ class Components(object):
         >>> edbapp.core_components.get_nets_from_pin_list(pinlist)
 
         """
-        netlist = []
-        for pin in PinList:
-            netlist.append(pin.GetNet().GetName())
-        return list(set(netlist))
+        return list(set(net_name for _, net_name in self._pin_nets(PinList)))
 
     @aedt_exception_handler
     def get_component_net_connection_info(self, refdes):
@@ -1059,16 +1170,39 @@ class Components(object):
         >>> edbapp.core_components.get_component_net_connection_info(refdes)
 
         """
-        component_pins = self.get_pin_from_component(refdes)
-        data = {"refdes": [], "pin_name": [], "net_name": []}
-        for pin_obj in component_pins:
-            pin_name = pin_obj.GetName()
-            net_name = pin_obj.GetNet().GetName()
-            if pin_name is not None:
-                data["refdes"].append(refdes)
-                data["pin_name"].append(pin_name)
-                data["net_name"].append(net_name)
-        return data
+        rows = self._get_net_connection_rows(refdes)
+        return {
+            "refdes": [row[0] for row in rows],
+            "pin_name": [row[1] for row in rows],
+            "net_name": [row[2] for row in rows],
+        }
+
+    def _get_net_connection_rows(self, refdes):
+        """Retrieve the net connection information of a component as rows.
+
+        The rows are cached until the components are modified and must not be modified by the caller.
+
+        Parameters
+        ----------
+        refdes : str
+            Reference designator of the component.
+
+        Returns
+        -------
+        list
+            List of ``(refdes, pin_name, net_name)`` tuples.
+        """
+        rows = self._net_conn_cache.get(refdes)
+        if rows is None:
+            cmp_pins = self._get_component_pins(refdes)
+            pin_names = [pin_obj.GetName() for pin_obj in cmp_pins.pins]
+            rows = [
+                (refdes, pin_name, net_name)
+                for pin_name, net_name in zip(pin_names, self._get_pin_net_names(cmp_pins))
+                if pin_name
+            ]
+            self._net_conn_cache[refdes] = rows
+        return rows
 
     def get_rats(self):
         """Retrieve a list of dictionaries of the reference designator, pin names, and net names.
@@ -1087,11 +1221,59 @@ class Components(object):
         >>> edbapp.core_components.get_rats()
 
         """
-        df_list = []
+        return [self.get_component_net_connection_info(refdes) for refdes in self.components.keys()]
+
+    def iter_rats(self):
+        """Iterate over the reference designator, pin name, and net name of all pins.
+
+        Pins are yielded one component at a time, so the result can be streamed to a file
+        without building the full list in memory.
+
+        Returns
+        -------
+        generator
+            Generator of ``(refdes, pin_name, net_name)`` tuples.
+
+        Examples
+        --------
+
+        >>> from pyaedt import Edb
+        >>> edbapp = Edb("myaedbfolder", "project name", "release version")
+        >>> for refdes, pin_name, net_name in edbapp.core_components.iter_rats():
+        ...     print(refdes, pin_name, net_name)
+
+        """
         for refdes in self.components.keys():
-            df = self.get_component_net_connection_info(refdes)
-            df_list.append(df)
-        return df_list
+            for row in self._get_net_connection_rows(refdes):
+                yield row
+
+    @aedt_exception_handler
+    def get_rats_dataframe(self):
+        """Retrieve the reference designator, pin name, and net name of all pins as a single table.
+
+        .. note::
+           This method requires the pandas module, which is available only in CPython.
+
+        Returns
+        -------
+        pandas.DataFrame
+            Data frame with one row per pin and the ``"refdes"``, ``"pin_name"``,
+            and ``"net_name"`` columns. ``False`` when pandas is not installed.
+
+        Examples
+        --------
+
+        >>> from pyaedt import Edb
+        >>> edbapp = Edb("myaedbfolder", "project name", "release version")
+        >>> edbapp.core_components.get_rats_dataframe()
+
+        """
+        try:
+            import pandas as pd
+        except ImportError:
+            self._logger.error("The pandas module is required to run this method. Install it with pip install pandas.")
+            return False
+        return pd.DataFrame.from_records(list(self.iter_rats()), columns=["refdes", "pin_name", "net_name"])
 
     def get_through_resistor_list(self, threshold=1):
         """Retrieve through resistors.
@@ -1114,17 +1296,55 @@ class Components(object):
         >>> edbapp.core_components.get_through_resistor_list()
 
         """
-        through_comp_list = []
-        for refdes, comp_obj in self.resistors.items():
+        return [refdes for refdes, value in self._get_two_pin_resistors() if value <= threshold]
+
+    def get_through_resistor_lists(self, thresholds):
+        """Retrieve through resistors for several threshold values at once.
+
+        Resistor values are read and parsed once for all thresholds.
+
+        Parameters
+        ----------
+        thresholds : list
+            List of threshold values.
+
+        Returns
+        -------
+        dict
+            Dictionary with the threshold values as keys and the lists of through resistors as values.
+
+        Examples
+        --------
 
-            numpins = comp_obj.numpins
+        >>> from pyaedt import Edb
+        >>> edbapp = Edb("myaedbfolder", "project name", "release version")
+        >>> edbapp.core_components.get_through_resistor_lists([0.1, 1, 10])
 
-            if numpins == 2:
+        """
+        two_pin_resistors = self._get_two_pin_resistors()
+        return {
+            threshold: [refdes for refdes, value in two_pin_resistors if value <= threshold] for threshold in thresholds
+        }
 
-                value = comp_obj.res_value
-                value = resistor_value_parser(value)
+    def _get_two_pin_resistors(self):
+        """Retrieve the reference designator and parsed value of the two-pin resistors.
 
-                if value <= threshold:
-                    through_comp_list.append(refdes)
+        The list is cached until the components or their RLC values are modified.
 
-        return through_comp_list
+        Returns
+        -------
+        list
+            List of ``(refdes, value)`` tuples.
+        """
+        if self._two_pin_resistors is None:
+            resistors = self.resistors
+            res_values = self._res_values
+            two_pin_resistors = []
+            for refdes, comp_obj in resistors.items():
+                if comp_obj.numpins == 2:
+                    value = res_values.get(refdes)
+                    if value is None:
+                        value = res_values[refdes] = resistor_value_parser(comp_obj.res_value)
+                    two_pin_resistors.append((refdes, value))
+            self._two_pin_resistors = two_pin_resistors
+        return self._two_pin_resistors
@@ -140,16 +140,15 @@ class EdbNets(object):
             List of nets connected to DC through inductors.
         """
         temp_list = []
+        ground_nets = frozenset(ground_nets)
         for refdes, comp_obj in self._pedb.core_components.inductors.items():
 
             numpins = comp_obj.numpins
 
             if numpins == 2:
                 nets = comp_obj.nets
-                if not set(nets).intersection(set(ground_nets)):
+                if not any(net in ground_nets for net in nets):
                     temp_list.append(set(nets))
-                else:
-                    pass
 
         dcconnected_net_list = []
 
@@ -257,7 +256,9 @@ class EdbNets(object):
                     self._logger.info("Net %s Deleted", net)
             except:
                 pass
-
+        if nets_deleted and self._pedb._components:
+            # Pin to net data cached by the components is no longer valid.
+            self._pedb._components.clear_cache()
         return nets_deleted
 
     @aedt_exception_handler
@@ -261,14 +261,12 @@ class SiwaveSolve(object):
             f.write("oDoc.ScrCloseProject()\n")
             f.write("oApp.Quit()\n")
         if os.name == "posix":
-            _exe = '"' + os.path.join(self.installer_path, "siwave") + '"'
+            _exe = os.path.join(self.installer_path, "siwave")
         else:
-            _exe = '"' + os.path.join(self.installer_path, "siwave.exe") + '"'
+            _exe = os.path.join(self.installer_path, "siwave.exe")
         command = [_exe]
         command.append("-RunScriptAndExit")
         command.append(scriptname)
         print(command)
-        os.system(" ".join(command))
-        #p1 = subprocess.call(" ".join(command))
-        #p1.wait()
+        subprocess.call(command)
         return os.path.join(output_folder, aedt_file_name)
@@ -9,7 +9,6 @@ from __future__ import absolute_import
 from pyaedt.generic.general_methods import aedt_exception_handler, is_ironpython, _pythonver
 import os
 import sys
-import pkgutil
 import time
 
 from pyaedt.misc import list_installed_ansysem
@@ -20,13 +19,14 @@ if is_ironpython:
     _com = "pythonnet"
     import System
 elif os.name == "nt":
-    modules = [tup[1] for tup in pkgutil.iter_modules()]
-    if "clr" in modules:
+    from importlib.util import find_spec
+
+    if find_spec("clr") is not None:
         import clr  # noqa: F401
         import win32com.client
 
         _com = "pythonnet_v3"
-    elif "win32com" in modules:
+    elif find_spec("win32com") is not None:
         import win32com.client
 
         _com = "pywin32"
@@ -1,5 +1,7 @@
 """Constants used by the protocol
 """
+import logging
+import os
 
 # messages
 MSG_REQUEST = 1
@@ -38,10 +40,38 @@ HANDLE_INSTANCECHECK = 20
 EXC_STOP_ITERATION = 1
 
 # IO values
-# read/write chunk is 640KB, too large of a value will degrade response for other clients
-#TODO Check the best value to not affect performances
-STREAM_CHUNK = 640000
+# read/write chunk is 512KB (a multiple of the memory page size), too large of a value will degrade
+# response for other clients. Set PYAEDT_RPYC_CHUNK (in bytes) to lower it for many small messages
+# or to raise it for large transfers such as geometry files.
+STREAM_CHUNK = 1 << 19
 
-# DEBUG
-# for k in globals().keys():
-#    globals()[k] = k
+
+def _stream_chunk_from_env(default):
+    value = os.environ.get("PYAEDT_RPYC_CHUNK")
+    if value is None:
+        return default
+    try:
+        chunk = int(value)
+    except ValueError:
+        chunk = 0
+    if chunk <= 0:
+        logging.getLogger(__name__).warning(
+            "Invalid PYAEDT_RPYC_CHUNK value %r, using the default of %d bytes", value, default)
+        return default
+    return chunk
+
+
+STREAM_CHUNK = _stream_chunk_from_env(STREAM_CHUNK)
+del _stream_chunk_from_env
+
+
+# tag names for logging, one mapping per kind of tag since their values overlap
+def _tag_names(prefix):
+    return dict((v, k) for k, v in globals().items() if k.startswith(prefix))
+
+
+MSG_NAMES = _tag_names("MSG_")
+LABEL_NAMES = _tag_names("LABEL_")
+HANDLE_NAMES = _tag_names("HANDLE_")
+EXC_NAMES = _tag_names("EXC_")
+del _tag_names
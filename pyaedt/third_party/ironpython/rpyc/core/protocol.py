@@ -126,6 +126,13 @@ Parameter                                Default value     Description
 _connection_id_generator = itertools.count(1)
 
 
+def _unknown_handler(handler):
+    """Returns a request handler that rejects the unassigned handler id like a dict lookup would"""
+    def _handle_unknown(self, *args):
+        raise KeyError(handler)
+    return _handle_unknown
+
+
 class Connection(object):
     """The RPyC *connection* (AKA *protocol*).
 
@@ -142,7 +149,9 @@ class Connection(object):
         if self._config["connid"] is None:
             self._config["connid"] = "conn%d" % (next(_connection_id_generator),)
 
-        self._HANDLERS = self._request_handlers()
+        # handler ids are small consecutive integers, index a list instead of hashing into a dict
+        handlers = self._request_handlers()
+        self._HANDLERS = [handlers.get(i) or _unknown_handler(i) for i in range(max(handlers) + 1)]
         self._channel = channel
         self._seqcounter = itertools.count()
         self._recvlock = Lock()
@@ -321,6 +330,8 @@ class Connection(object):
         try:
             handler, args = raw_args
             args = self._unbox(args)
+            if not 0 <= handler < len(self._HANDLERS):
+                raise KeyError(handler)
             res = self._HANDLERS[handler](self, *args)
         except:  # TODO: revist how to catch handle locally, this should simplify when py2 is dropped
             # need to catch old style exceptions too
@@ -354,7 +365,7 @@ class Connection(object):
             _callback(is_exc, obj)
         elif self._config["logger"] is not None:
             debug_msg = 'Recieved {} seq {} and a related request callback did not exist'
-            self._config["logger"].debug(debug_msg.format(msg, seq))
+            self._config["logger"].debug(debug_msg.format(consts.MSG_NAMES.get(msg, msg), seq))
 
     def _dispatch(self, data):  # serving---dispatch?
         msg, seq, args = brine.load(data)